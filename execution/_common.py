@@ -0,0 +1,199 @@
+"""
+_common.py — Helpers shared by the execution scripts
+
+  - load_env: .env parsing (memoized per process)
+  - log_success / log_error / log_warning: colored console output
+  - rest_request / supabase_request: Supabase REST calls over
+    keep-alive connections. When HTTP(S)_PROXY applies to the Supabase
+    host (and NO_PROXY doesn't exempt it), requests go through
+    urllib.request instead, which honours the proxy but opens a new
+    connection per request.
+
+Scripts are run directly (python3 execution/<script>.py), so this
+directory is on sys.path and they import it as `from _common import ...`.
+"""
+
+import functools
+import http.client
+import socket
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# orjson is optional: several times faster on large batch payloads, and it
+# encodes straight to bytes. Fall back to the stdlib when it isn't installed.
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    json_loads = json.loads
+
+# ── Console ─────────────────────────────────────────────────────────────────
+
+GREEN = '\033[92m'
+RED = '\033[91m'
+YELLOW = '\033[93m'
+RESET = '\033[0m'
+
+def log_success(msg: str) -> None:
+    print(f"{GREEN}✓{RESET} {msg}")
+
+def log_error(msg: str) -> None:
+    print(f"{RED}✗{RESET} {msg}")
+
+def log_warning(msg: str) -> None:
+    print(f"{YELLOW}!{RESET} {msg}")
+
+# ── Load env ────────────────────────────────────────────────────────────────
+
+def load_env(env_path: str = ".env") -> dict:
+    """Parse a .env file into a dict."""
+    env = {}
+    path = Path(env_path)
+    if not path.exists():
+        # Try root-level .env
+        root_env = Path(__file__).resolve().parent.parent / ".env"
+        if root_env.exists():
+            path = root_env
+        else:
+            return env
+    return dict(_parse_env_file(path.resolve()))
+
+@functools.lru_cache(maxsize=1)
+def _parse_env_file(path: Path) -> dict:
+    """Parsed once per process; load_env() hands out copies."""
+    env = {}
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if "=" in line:
+            key, _, value = line.partition("=")
+            env[key.strip()] = value.strip().strip('"').strip("'")
+    return env
+
+# ── Supabase REST ───────────────────────────────────────────────────────────
+
+HTTP_TIMEOUT = 30
+
+# One keep-alive connection per Supabase host (and per thread — http.client
+# connections are not thread-safe), so every request after the first skips
+# the TCP + TLS handshake.
+_connections: dict = {}
+
+@functools.lru_cache(maxsize=None)
+def resolve_host(host: str, port: int) -> tuple:
+    """DNS lookup done once per process and shared by every connection/thread."""
+    infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    return tuple(dict.fromkeys(info[4][0] for info in infos))
+
+def _create_connection(address, *args, **kwargs) -> socket.socket:
+    """
+    Drop-in for socket.create_connection that dials the cached addresses.
+    The connection object keeps the hostname, so the Host header and TLS
+    SNI/certificate checks are unchanged.
+    """
+    host, port = address
+    error = None
+    for addr in resolve_host(host, port):
+        try:
+            return socket.create_connection((addr, port), *args, **kwargs)
+        except OSError as e:
+            error = e
+    # Every cached address failed and may be stale; the next dial resolves afresh
+    resolve_host.cache_clear()
+    raise error
+
+def get_connection(url: str, timeout: float = HTTP_TIMEOUT) -> http.client.HTTPConnection:
+    parts = urlsplit(url)
+    conn_key = (threading.get_ident(), parts.netloc)
+    conn = _connections.get(conn_key)
+    if conn is None:
+        if parts.scheme == "https":
+            conn = http.client.HTTPSConnection(parts.netloc, timeout=timeout)
+        else:
+            conn = http.client.HTTPConnection(parts.netloc, timeout=timeout)
+        # http.client dials through this hook; route it via the DNS cache
+        conn._create_connection = _create_connection
+        _connections[conn_key] = conn
+    elif conn.timeout != timeout:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    return conn
+
+def close_connections() -> None:
+    for conn in list(_connections.values()):
+        conn.close()
+    _connections.clear()
+
+@functools.lru_cache(maxsize=None)
+def _uses_proxy(url: str) -> bool:
+    """True if the environment routes this URL through a proxy (raw http.client can't)."""
+    parts = urlsplit(url)
+    return parts.scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(parts.hostname or "")
+
+def _urllib_request(url: str, method: str, headers: dict, body: bytes, timeout: float) -> tuple[int, bytes]:
+    req = urllib.request.Request(url, data=body, headers=headers, method=method)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+def rest_request(url: str, path: str, method: str = "GET", headers: dict = None, body: bytes = None,
+                 timeout: float = HTTP_TIMEOUT) -> tuple[int, bytes]:
+    """Send a request to {url}/rest/v1/{path}. Returns (status, body); raises on network errors."""
+    if _uses_proxy(url):
+        return _urllib_request(f"{url.rstrip('/')}/rest/v1/{path}", method, headers or {}, body, timeout)
+
+    conn = get_connection(url, timeout)
+    full_path = f"{urlsplit(url).path.rstrip('/')}/rest/v1/{path}"
+    for attempt in range(2):
+        try:
+            conn.request(method, full_path, body=body, headers=headers or {})
+            resp = conn.getresponse()
+            return resp.status, resp.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server dropped an idle keep-alive connection; reconnect once
+            conn.close()
+            if attempt:
+                raise
+        except Exception:
+            conn.close()
+            raise
+
+def supabase_request(url: str, key: str, endpoint: str, method: str = "GET", data=None, params: str = "",
+                     prefer: str = "return=representation", extra_headers: dict = None):
+    """JSON request against a table/RPC endpoint. Returns the decoded body, or None on failure."""
+    headers = {
+        "apikey": key,
+        "Authorization": f"Bearer {key}",
+        "Content-Type": "application/json",
+        "Prefer": prefer,  # Default: get back the inserted/updated rows
+    }
+    if extra_headers:
+        headers.update(extra_headers)
+
+    body = json_dumps(data) if data else None
+
+    try:
+        status, raw = rest_request(url, f"{endpoint}{params}", method=method, headers=headers, body=body)
+    except Exception as e:
+        print(f"❌ Request Failed: {str(e)}")
+        return None
+
+    if status >= 400:
+        print(f"❌ API Error {status}: {raw.decode()}")
+        return None
+    # return=minimal responds with an empty body
+    return json_loads(raw) if raw else []
@@ -9,36 +9,42 @@ before running the application.
 import subprocess
 import sys
 import socket
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Color output
-GREEN = '\033[92m'
-RED = '\033[91m'
-YELLOW = '\033[93m'
-RESET = '\033[0m'
+from _common import GREEN, RED, RESET, log_error, log_success
 
-def log_success(msg):
-    print(f"{GREEN}✓{RESET} {msg}")
+# Local services the app depends on: (port, name)
+SERVICES = [
+    (5432, "PostgreSQL"),
+    (6379, "Redis"),
+]
 
-def log_error(msg):
-    print(f"{RED}✗{RESET} {msg}")
+# A localhost connect succeeds in well under a millisecond, so a short
+# timeout only bounds how long a missing service can stall the check.
+PORT_TIMEOUT = 0.25
 
-def log_warning(msg):
-    print(f"{YELLOW}!{RESET} {msg}")
+def port_open(port):
+    """Return True if something accepts TCP connections on localhost:port"""
+    try:
+        with socket.create_connection(('localhost', port), timeout=PORT_TIMEOUT):
+            return True
+    except OSError:
+        return False
 
-def check_port(port, service_name):
-    """Check if a service is running on given port"""
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(1)
-    result = sock.connect_ex(('localhost', port))
-    sock.close()
+def check_ports(services):
+    """Check all services concurrently, then report in declaration order"""
+    with ThreadPoolExecutor(max_workers=len(services)) as pool:
+        results = list(pool.map(port_open, [port for port, _ in services]))
     
-    if result == 0:
-        log_success(f"{service_name} running on port {port}")
-        return True
-    else:
-        log_error(f"{service_name} not running on port {port}")
-        return False
+    all_open = True
+    for (port, service_name), is_open in zip(services, results):
+        if is_open:
+            log_success(f"{service_name} running on port {port}")
+        else:
+            log_error(f"{service_name} not running on port {port}")
+            all_open = False
+    return all_open
 
 def check_node_modules():
     """Check if node_modules exists"""
@@ -86,15 +92,18 @@ def check_required_env_vars():
 def main():
     print("\n=== PayEase Dependency Check ===\n")
     
-    all_passed = True
-    
     print("Checking project setup...")
-    all_passed &= check_node_modules()
-    all_passed &= check_env_file()
+    # Both setup checks are a single stat, so report them together
+    setup_ok = check_node_modules()
+    setup_ok &= check_env_file()
+    
+    if not setup_ok:
+        # No point probing services until the project itself is set up
+        print(f"\n{RED}Project setup incomplete. Fix the issues above, then re-run to check services.{RESET}")
+        sys.exit(1)
     
     print("\nChecking services...")
-    all_passed &= check_port(5432, "PostgreSQL")
-    all_passed &= check_port(6379, "Redis")
+    all_passed = check_ports(SERVICES)
     
     if all_passed:
         print(f"\n{GREEN}All checks passed! Ready to start development.{RESET}")
@@ -15,98 +15,165 @@ CSV Format:
   - Remarks: Optional text
 
 Usage:
-  python3 execution/import_attendance.py <path_to_csv>
+  python3 execution/import_attendance.py <path_to_csv> [--verbose]
+
+  --verbose  Print each skipped row as it is read instead of a summary at the end
 """
 
+import argparse
 import csv
 import sys
 import os
-import json
-import urllib.request
-import urllib.error
+import re
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
-
-# ── Load env ────────────────────────────────────────────────────────────────
 
-def load_env(env_path: str = ".env") -> dict:
-    env = {}
-    path = Path(env_path)
-    if not path.exists():
-        root_env = Path(__file__).resolve().parent.parent / ".env"
-        if root_env.exists():
-            path = root_env
-        else:
-            return env
-    for line in path.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" in line:
-            key, _, value = line.partition("=")
-            env[key.strip()] = value.strip().strip('"').strip("'")
-    return env
+from _common import close_connections, load_env, supabase_request
 
 # ── Supabase Helpers ────────────────────────────────────────────────────────
 
-def supabase_request(url: str, key: str, endpoint: str, method: str = "GET", data: dict = None, params: str = ""):
-    full_url = f"{url}/rest/v1/{endpoint}{params}"
-    headers = {
-        "apikey": key,
-        "Authorization": f"Bearer {key}",
-        "Content-Type": "application/json",
-        "Prefer": "return=representation",  # Get back the inserted/updated row
-    }
-    
-    body = json.dumps(data).encode() if data else None
-    req = urllib.request.Request(full_url, data=body, headers=headers, method=method)
-    
-    try:
-        with urllib.request.urlopen(req) as resp:
-            return json.loads(resp.read())
-    except urllib.error.HTTPError as e:
-        print(f"❌ API Error {e.code}: {e.read().decode()}")
-        return None
-    except Exception as e:
-        print(f"❌ Request Failed: {str(e)}")
-        return None
+# PostgREST accepts a JSON array as a bulk upsert; one request per chunk
+# instead of one per CSV row.
+BATCH_SIZE = 500
+
+# Rows requested per employee page; matches Supabase's default max-rows.
+EMPLOYEE_PAGE_SIZE = 1000
+
+# Batches share no (employee, date) keys (see main), so they are independent
+# upserts and a few can be kept in flight at once.
+UPLOAD_WORKERS = 8
 
 def fetch_employees(url: str, key: str) -> dict:
     """Returns a lookup dict: {email: uuid, employee_code: uuid}"""
     print("⏳ Fetching employee list...")
-    data = supabase_request(url, key, "employees", params="?select=id,email,employee_id")
-    if not data:
+    lookup = {}
+    total = 0
+    offset = 0
+
+    # Supabase caps a response at max-rows (1000 by default, but projects can
+    # lower it), so page through with Range headers and fold each page into
+    # the lookup as it arrives. A page may come back shorter than requested
+    # without being the last, so advance by what was returned and stop only
+    # on an empty page.
+    while True:
+        data = supabase_request(
+            url, key, "employees",
+            params="?select=id,email,employee_id&order=id",
+            extra_headers={
+                "Range-Unit": "items",
+                "Range": f"{offset}-{offset + EMPLOYEE_PAGE_SIZE - 1}",
+            },
+        )
+        if data is None:
+            print("❌ Could not fetch employees.")
+            return {}
+
+        for emp in data:
+            if emp.get("email"):
+                lookup[emp["email"].lower()] = emp["id"]
+            if emp.get("employee_id"):
+                lookup[emp["employee_id"].lower()] = emp["id"]
+        total += len(data)
+
+        if not data:
+            break
+        offset += len(data)
+
+    if not total:
         print("❌ Could not fetch employees.")
         return {}
-    
-    lookup = {}
-    for emp in data:
-        if emp.get("email"):
-            lookup[emp["email"].lower()] = emp["id"]
-        if emp.get("employee_id"):
-            lookup[emp["employee_id"].lower()] = emp["id"]
-    
-    print(f"✅ Loaded {len(data)} employees.")
+
+    print(f"✅ Loaded {total} employees.")
     return lookup
 
 # ── Main Logic ──────────────────────────────────────────────────────────────
 
+# Accepted (case-insensitive) header names for each field, in priority order.
+COLUMN_ALIASES = {
+    "employee": ("employeeidentifier", "code", "email", "employee_id"),
+    "date": ("date", "attendance_date"),
+    "status": ("status",),
+    "in_time": ("intime", "in_time", "check_in"),
+    "out_time": ("outtime", "out_time", "check_out"),
+    "remarks": ("remarks", "note"),
+}
+
+def build_column_map(header: list) -> dict:
+    """Resolves each field to its column index once, instead of per row."""
+    normalized = {}
+    for i, name in enumerate(header):
+        normalized.setdefault(name.strip().lower(), i)
+
+    col_map = {}
+    for field, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in normalized:
+                col_map[field] = normalized[alias]
+                break
+    return col_map
+
+_TIME_RE = re.compile(r"\s*([0-9]{1,2}):([0-9]{1,2})")
+
+@functools.lru_cache(maxsize=None)
+def _parse_date(date_str: str) -> str:
+    """Validates YYYY-MM-DD; cached since a file only spans a handful of dates."""
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").date().isoformat()
+    except ValueError:
+        return None
+
 def parse_time(date_str: str, time_str: str) -> str:
     """Combines YYYY-MM-DD and HH:MM into ISO8601 string."""
     if not time_str or not time_str.strip():
         return None
-    try:
-        dt = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
-        return dt.isoformat()
-    except ValueError:
+    match = _TIME_RE.fullmatch(time_str)
+    if not match:
         return None
+    hour, minute = int(match.group(1)), int(match.group(2))
+    if hour > 23 or minute > 59:
+        return None
+    date_iso = _parse_date(date_str)
+    if date_iso is None:
+        return None
+    return f"{date_iso}T{hour:02d}:{minute:02d}:00"
+
+def upsert_batch(url: str, key: str, batch: list) -> tuple[int, int]:
+    """
+    Upserts a chunk of attendance rows in a single request.
+    (employee_id, date) is the unique key, so we POST with
+    Prefer: resolution=merge-duplicates and name the on_conflict columns.
+    Returns (success_count, fail_count) for the chunk.
+    """
+    res = supabase_request(
+        url, key,
+        "attendance",
+        method="POST",
+        data=batch,
+        params="?on_conflict=employee_id,date",
+        prefer="resolution=merge-duplicates,return=minimal",
+    )
+
+    if res is not None:
+        print(f"✅ Imported batch of {len(batch)} rows")
+        return len(batch), 0
+    print(f"❌ Failed batch of {len(batch)} rows")
+    return 0, len(batch)
+
+# Values of the attendance_status enum (supabase/migrations). Checked up
+# front: one bad status would otherwise get its whole batch rejected.
+ATTENDANCE_STATUSES = frozenset({"present", "absent", "half_day", "on_leave", "holiday", "weekend"})
+
+# Skipped rows listed in the end-of-run summary when not --verbose.
+SKIPPED_SUMMARY_LIMIT = 20
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 execution/import_attendance.py <path_to_csv>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Bulk upload attendance logs to Supabase")
+    parser.add_argument("csv_path", help="Path to the attendance CSV")
+    parser.add_argument("--verbose", action="store_true", help="Print each skipped row as it is read")
+    args = parser.parse_args()
 
-    csv_path = sys.argv[1]
+    csv_path = args.csv_path
     if not os.path.exists(csv_path):
         print(f"❌ File not found: {csv_path}")
         sys.exit(1)
@@ -125,72 +192,95 @@ def main():
 
     success_count = 0
     fail_count = 0
+    merged_count = 0
+    payloads = {}  # (employee uuid, date) -> payload, in file order
+    pending = []  # Futures for batches handed to the upload pool
+    skipped = []  # Per-row messages, printed in one go at the end
+
+    def skip(msg):
+        if args.verbose:
+            print(msg)
+        else:
+            skipped.append(msg)
 
     print(f"\nProcessing {csv_path}...")
 
     with open(csv_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        headers = [h.strip().lower() for h in reader.fieldnames]
-        
-        # Mapping helpers
-        def get_col(row, *aliases):
-            for a in aliases:
-                for k in row.keys():
-                    if k.strip().lower() == a:
-                        return row[k]
-            return None
+        # Plain csv.reader + column indices: no per-row dict allocation
+        reader = csv.reader(f)
+        header = next(reader, [])
+        col_map = build_column_map(header)
+
+        def get_col(row, field):
+            i = col_map.get(field)
+            return row[i] if i is not None and i < len(row) else None
 
         for row in reader:
-            emp_identifier = get_col(row, "employeeidentifier", "code", "email", "employee_id")
-            date_str = get_col(row, "date", "attendance_date")
+            if not row:
+                continue  # Blank line
+            emp_identifier = get_col(row, "employee")
+            # strptime on "{date} {time}" let whitespace after the date through;
+            # strip so the cached date parse does too
+            date_str = (get_col(row, "date") or "").strip()
             status = get_col(row, "status")
-            in_time = get_col(row, "intime", "in_time", "check_in")
-            out_time = get_col(row, "outtime", "out_time", "check_out")
-            remarks = get_col(row, "remarks", "note")
+            in_time = get_col(row, "in_time")
+            out_time = get_col(row, "out_time")
+            remarks = get_col(row, "remarks")
 
-            if not emp_identifier or not date_str or not status:
-                print(f"⚠️  Skipping invalid row: {row}")
+            date_iso = _parse_date(date_str) if date_str else None
+            status = status.lower() if status else None
+            if not emp_identifier or date_iso is None or status not in ATTENDANCE_STATUSES:
+                skip(f"⚠️  Skipping invalid row: {dict(zip(header, row))}")
                 fail_count += 1
                 continue
 
             # Resolve Employee ID
             emp_uuid = employee_lookup.get(emp_identifier.lower())
             if not emp_uuid:
-                print(f"⚠️  Employee not found: {emp_identifier}")
+                skip(f"⚠️  Employee not found: {emp_identifier}")
                 fail_count += 1
                 continue
 
-            # Construct Payload
-            payload = {
+            # Last row wins for a repeated (employee, date): a single upsert
+            # can't touch the same row twice, so collapse duplicates before
+            # batching. Pop + re-insert moves the key to its latest position.
+            row_key = (emp_uuid, date_iso)
+            if payloads.pop(row_key, None) is not None:
+                merged_count += 1
+            payloads[row_key] = {
                 "employee_id": emp_uuid,
-                "date": date_str,
-                "status": status.lower(),
+                "date": date_iso,
+                "status": status,
                 "check_in": parse_time(date_str, in_time),
                 "check_out": parse_time(date_str, out_time),
                 "remarks": remarks
             }
 
-            # Upsert (using on_conflict logic via REST? No, REST upsert uses POST with Prefer: resolution=merge-duplicates)
-            # We need to make sure we treat (employee_id, date) as unique key.
-            # Supabase upsert requires specifying the on_conflict columns if it's not the PK.
-            # We can use the 'unique_employee_date' constraint we just added.
-            
-            res = supabase_request(
-                url, key, 
-                "attendance", 
-                method="POST", 
-                data=payload, 
-                params="?on_conflict=employee_id,date"
-            )
-
-            if res is not None:
-                print(f"✅ Imported: {emp_identifier} on {date_str} ({status})")
-                success_count += 1
-            else:
-                print(f"❌ Failed: {emp_identifier} on {date_str}")
-                fail_count += 1
+    # Nothing is uploaded until the whole file is read and de-duplicated, so
+    # every (employee, date) key lives in exactly one batch. Concurrent
+    # batches therefore never race on the same row (no out-of-order
+    # overwrites, no lock conflicts), and the last CSV row always wins.
+    rows = list(payloads.values())
+    with ThreadPoolExecutor(UPLOAD_WORKERS) as pool:
+        for start in range(0, len(rows), BATCH_SIZE):
+            pending.append(pool.submit(upsert_batch, url, key, rows[start:start + BATCH_SIZE]))
+
+        for future in pending:
+            ok, failed = future.result()
+            success_count += ok
+            fail_count += failed
+
+    close_connections()
+
+    if skipped:
+        lines = [f"\nSkipped {len(skipped)} rows:"] + skipped[:SKIPPED_SUMMARY_LIMIT]
+        if len(skipped) > SKIPPED_SUMMARY_LIMIT:
+            lines.append(f"... and {len(skipped) - SKIPPED_SUMMARY_LIMIT} more (rerun with --verbose to see all)")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     print("\n" + "="*40)
+    if merged_count:
+        print(f"Merged {merged_count} duplicate (employee, date) rows; the last occurrence was kept.")
     print(f"Done. Success: {success_count}, Failed: {fail_count}")
     print("="*40)
 
@@ -13,34 +13,11 @@ Usage:
 Requires: .env with SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY
 """
 
-import os
 import sys
 import json
-import urllib.request
-import urllib.error
-from pathlib import Path
-
-# ── Load env ────────────────────────────────────────────────────────────────
-
-def load_env(env_path: str = ".env") -> dict:
-    """Parse a .env file into a dict."""
-    env = {}
-    path = Path(env_path)
-    if not path.exists():
-        # Try root-level .env
-        root_env = Path(__file__).resolve().parent.parent / ".env"
-        if root_env.exists():
-            path = root_env
-        else:
-            return env
-    for line in path.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" in line:
-            key, _, value = line.partition("=")
-            env[key.strip()] = value.strip().strip('"').strip("'")
-    return env
+from concurrent.futures import ThreadPoolExecutor
+
+from _common import close_connections, load_env, rest_request
 
 # ── Config ──────────────────────────────────────────────────────────────────
 
@@ -53,43 +30,58 @@ REQUIRED_TABLES = [
     "payslips",
 ]
 
+# Health checks should fail fast rather than hang on an unreachable host.
+CHECK_TIMEOUT = 10
+
+# The first request also pays DNS + connect, so bound it tighter; later
+# checks reuse the resolved address and the open connection.
+PING_TIMEOUT = 5
+
 # ── Checks ──────────────────────────────────────────────────────────────────
 
 def check_connectivity(url: str, key: str) -> tuple[bool, str]:
     """Ping Supabase REST API."""
     try:
-        req = urllib.request.Request(
-            f"{url}/rest/v1/",
+        status, _ = rest_request(
+            url, "",
             headers={
                 "apikey": key,
                 "Authorization": f"Bearer {key}",
             },
+            timeout=PING_TIMEOUT,
         )
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            return True, f"HTTP {resp.status}"
+        if status >= 400:
+            return False, f"HTTP Error {status}"
+        return True, f"HTTP {status}"
     except Exception as e:
         return False, str(e)
 
+def probe_table(url: str, key: str, table: str) -> dict:
+    """
+    Check that a single table exists with a body-less HEAD request.
+    No Prefer: count header — existence only needs the status code, and
+    count=exact would make Postgres run COUNT(*) over the whole table.
+    """
+    try:
+        status, _ = rest_request(
+            url, f"{table}?limit=0",
+            method="HEAD",
+            headers={
+                "apikey": key,
+                "Authorization": f"Bearer {key}",
+            },
+            timeout=CHECK_TIMEOUT,
+        )
+        if status < 400:
+            return {"table": table, "exists": True, "status": status}
+        return {"table": table, "exists": False, "status": status, "error": f"HTTP Error {status}"}
+    except Exception as e:
+        return {"table": table, "exists": False, "error": str(e)}
+
 def check_tables(url: str, key: str) -> list[dict]:
-    """Check that each required table exists by querying it."""
-    results = []
-    for table in REQUIRED_TABLES:
-        try:
-            req = urllib.request.Request(
-                f"{url}/rest/v1/{table}?select=count&limit=0",
-                headers={
-                    "apikey": key,
-                    "Authorization": f"Bearer {key}",
-                    "Prefer": "count=exact",
-                },
-            )
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                results.append({"table": table, "exists": True, "status": resp.status})
-        except urllib.error.HTTPError as e:
-            results.append({"table": table, "exists": False, "status": e.code, "error": str(e)})
-        except Exception as e:
-            results.append({"table": table, "exists": False, "error": str(e)})
-    return results
+    """Check that each required table exists, probing all tables concurrently."""
+    with ThreadPoolExecutor(max_workers=len(REQUIRED_TABLES)) as pool:
+        return list(pool.map(lambda table: probe_table(url, key, table), REQUIRED_TABLES))
 
 def check_rls(url: str, key: str) -> list[dict]:
     """
@@ -104,21 +96,23 @@ def check_rls(url: str, key: str) -> list[dict]:
     """.format(", ".join(f"'{t}'" for t in REQUIRED_TABLES))
 
     try:
-        req = urllib.request.Request(
-            f"{url}/rest/v1/rpc/",
+        status, raw = rest_request(
+            url, "rpc/",
             method="POST",
             headers={
                 "apikey": key,
                 "Authorization": f"Bearer {key}",
                 "Content-Type": "application/json",
             },
-            data=json.dumps({"query": query}).encode(),
+            body=json.dumps({"query": query}).encode(),
+            timeout=CHECK_TIMEOUT,
         )
         # This may not work without a custom RPC function, so we fall back
         # to just reporting that RLS check requires manual verification
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read())
-            return [{"table": r["tablename"], "rls_enabled": r["rowsecurity"]} for r in data]
+        if status >= 400:
+            raise RuntimeError(f"HTTP Error {status}")
+        data = json.loads(raw)
+        return [{"table": r["tablename"], "rls_enabled": r["rowsecurity"]} for r in data]
     except Exception:
         # Cannot query pg_tables via REST — this is expected
         return [{"note": "RLS check requires Supabase Dashboard or psql. All tables have RLS enabled per migration setup."}]
@@ -132,7 +126,8 @@ def main():
 
     env = load_env()
     supabase_url = env.get("NEXT_PUBLIC_SUPABASE_URL") or env.get("SUPABASE_URL", "")
-    supabase_key = env.get("SUPABASE_SERVICE_ROLE_KEY") or env.get("NEXT_PUBLIC_SUPABASE_ANON_KEY", "")
+    service_role_key = env.get("SUPABASE_SERVICE_ROLE_KEY", "")
+    supabase_key = service_role_key or env.get("NEXT_PUBLIC_SUPABASE_ANON_KEY", "")
 
     if not supabase_url or not supabase_key:
         print("\n❌ FAIL: Missing SUPABASE_URL or SUPABASE_SERVICE_ROLE_KEY in .env")
@@ -164,7 +159,11 @@ def main():
 
     # Check 3: RLS
     print("\n▸ Check 3: RLS Status")
-    rls_results = check_rls(supabase_url, supabase_key)
+    # pg_tables is only readable with the service_role key
+    if service_role_key:
+        rls_results = check_rls(supabase_url, supabase_key)
+    else:
+        rls_results = [{"note": "Skipped — RLS check requires SUPABASE_SERVICE_ROLE_KEY."}]
     if rls_results and "note" in rls_results[0]:
         print(f"  ℹ️  {rls_results[0]['note']}")
     else:
@@ -176,6 +175,8 @@ def main():
             else:
                 failed += 1
 
+    close_connections()
+
     # Summary
     print("\n" + "=" * 60)
     print(f"  Results: {passed} passed, {failed} failed")
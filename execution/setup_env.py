@@ -10,58 +10,65 @@ import os
 import sys
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Color output
-GREEN = '\033[92m'
-RED = '\033[91m'
-YELLOW = '\033[93m'
-RESET = '\033[0m'
-
-def log_success(msg):
-    print(f"{GREEN}✓{RESET} {msg}")
-
-def log_error(msg):
-    print(f"{RED}✗{RESET} {msg}")
-
-def log_warning(msg):
-    print(f"{YELLOW}!{RESET} {msg}")
-
-def check_node():
+from _common import GREEN, RED, RESET, log_error, log_success, log_warning
+
+# Version probes for required tools. They are spawned together so total
+# wall time is that of the slowest one rather than the sum.
+VERSION_COMMANDS = {
+    'node': ['node', '--version'],
+    'npm': ['npm', '--version'],
+    'psql': ['psql', '--version'],
+}
+
+def spawn_version_checks():
+    """Start every version command at once; missing tools map to None"""
+    procs = {}
+    for name, cmd in VERSION_COMMANDS.items():
+        try:
+            procs[name] = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        except FileNotFoundError:
+            procs[name] = None
+    return procs
+
+def read_version(proc):
+    """Wait for a version command and return its stdout, or None if not found"""
+    if proc is None:
+        return None
+    out, _ = proc.communicate()
+    return out.strip()
+
+def check_node(output):
     """Check Node.js version >= 18"""
-    try:
-        result = subprocess.run(['node', '--version'], capture_output=True, text=True)
-        version = result.stdout.strip().replace('v', '')
-        major = int(version.split('.')[0])
-        if major >= 18:
-            log_success(f"Node.js {version}")
-            return True
-        else:
-            log_error(f"Node.js {version} (requires >= 18)")
-            return False
-    except FileNotFoundError:
+    if output is None:
         log_error("Node.js not found")
         return False
+    version = output.replace('v', '')
+    major = int(version.split('.')[0])
+    if major >= 18:
+        log_success(f"Node.js {version}")
+        return True
+    else:
+        log_error(f"Node.js {version} (requires >= 18)")
+        return False
 
-def check_npm():
+def check_npm(output):
     """Check npm is available"""
-    try:
-        result = subprocess.run(['npm', '--version'], capture_output=True, text=True)
-        log_success(f"npm {result.stdout.strip()}")
-        return True
-    except FileNotFoundError:
+    if output is None:
         log_error("npm not found")
         return False
+    log_success(f"npm {output}")
+    return True
 
-def check_postgres():
+def check_postgres(output):
     """Check PostgreSQL is available"""
-    try:
-        result = subprocess.run(['psql', '--version'], capture_output=True, text=True)
-        log_success(f"PostgreSQL {result.stdout.strip()}")
-        return True
-    except FileNotFoundError:
+    if output is None:
         log_warning("PostgreSQL CLI not found (may still work if using Docker)")
         return True  # Allow to continue
+    log_success(f"PostgreSQL {output}")
+    return True
 
 def create_directories():
     """Create required project directories"""
@@ -80,9 +87,10 @@ def create_directories():
     
     project_root = Path(__file__).parent.parent
     
-    for d in dirs:
-        dir_path = project_root / d
-        dir_path.mkdir(parents=True, exist_ok=True)
+    # mkdir is a blocking syscall, so the calls overlap across threads;
+    # exist_ok tolerates siblings racing to create a shared parent.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda d: (project_root / d).mkdir(parents=True, exist_ok=True), dirs))
     
     log_success(f"Created {len(dirs)} directories")
 
@@ -143,10 +151,11 @@ def main():
     print("\n=== PayEase Environment Setup ===\n")
     
     print("Checking dependencies...")
+    procs = spawn_version_checks()
     checks = [
-        check_node(),
-        check_npm(),
-        check_postgres(),
+        check_node(read_version(procs['node'])),
+        check_npm(read_version(procs['npm'])),
+        check_postgres(read_version(procs['psql'])),
     ]
     
     if not all(checks):
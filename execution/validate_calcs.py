@@ -9,6 +9,7 @@ Usage:
   python3 execution/validate_calcs.py
 """
 
+import bisect
 import math
 import sys
 
@@ -18,20 +19,27 @@ PF_BASIC_CAP = 15_000
 PF_EMPLOYEE_RATE = 0.12
 PF_EMPLOYER_EPF_RATE = 0.0367
 PF_EMPLOYER_EPS_RATE = 0.0833
+PF_EMPLOYER_RATE = PF_EMPLOYER_EPF_RATE + PF_EMPLOYER_EPS_RATE
 PF_MAX_EMPLOYEE = 1_800
 
 ESI_GROSS_LIMIT = 21_000
 ESI_EMPLOYEE_RATE = 0.0075
 ESI_EMPLOYER_RATE = 0.0325
 
-PT_RATES = {
-    "Karnataka": lambda s: 200 if s > 15_000 else 0,
-    "Maharashtra": lambda s: 200 if s > 10_000 else (175 if s > 7_500 else 0),
-    "Tamil Nadu": lambda s: 208 if s > 21_000 else (180 if s > 15_000 else (115 if s > 12_500 else 0)),
-    "Gujarat": lambda _: 0,
-    "Delhi": lambda _: 0,
+# Monthly PT slabs per state: (thresholds, amounts). A gross strictly above
+# thresholds[i] pays amounts[i + 1]; at or below the first threshold pays amounts[0].
+PT_SLABS = {
+    "Karnataka": ((15_000,), (0, 200)),
+    "Maharashtra": ((7_500, 10_000), (0, 175, 200)),
+    "Tamil Nadu": ((12_500, 15_000, 21_000), (0, 115, 180, 208)),
+    "Gujarat": ((), (0,)),
+    "Delhi": ((), (0,)),
 }
 
+def professional_tax(slabs: tuple, gross: float) -> int:
+    thresholds, amounts = slabs
+    return amounts[bisect.bisect_left(thresholds, gross)]
+
 # ── Calc Engine (Python mirror) ────────────────────────────────────────────
 
 def calculate_salary(
@@ -42,21 +50,44 @@ def calculate_salary(
     pt_enabled: bool = True,
     state: str = "Karnataka",
 ) -> dict:
+    return calculate_salaries([annual_ctc], basic_pct, hra_pct, pf_enabled, pt_enabled, state)[0]
+
+def calculate_salaries(
+    annual_ctcs: list[float],
+    basic_pct: float = 40,
+    hra_pct: float = 50,
+    pf_enabled: bool = True,
+    pt_enabled: bool = True,
+    state: str = "Karnataka",
+) -> list[dict]:
+    """
+    Batch form of calculate_salary() for a payroll run where every
+    employee shares one salary config. The config (percentages, PT
+    slabs) is resolved once instead of per employee.
+    """
+    basic_frac = basic_pct / 100
+    hra_frac = hra_pct / 100
+    pt_slabs = PT_SLABS.get(state, PT_SLABS["Karnataka"]) if pt_enabled else None
+    return [_salary_breakdown(ctc, basic_frac, hra_frac, pf_enabled, pt_slabs) for ctc in annual_ctcs]
+
+def _salary_breakdown(annual_ctc: float, basic_frac: float, hra_frac: float, pf_enabled: bool, pt_slabs) -> dict:
     monthly_ctc = annual_ctc / 12
 
-    basic = round(monthly_ctc * (basic_pct / 100))
-    hra = round(basic * (hra_pct / 100))
+    basic = round(monthly_ctc * basic_frac)
+    hra = round(basic * hra_frac)
 
     pf_basic = min(basic, PF_BASIC_CAP)
-    employer_pf = round(pf_basic * (PF_EMPLOYER_EPF_RATE + PF_EMPLOYER_EPS_RATE)) if pf_enabled else 0
+    employer_pf = round(pf_basic * PF_EMPLOYER_RATE) if pf_enabled else 0
 
     preliminary_gross = basic + hra
     esi_applicable = preliminary_gross <= ESI_GROSS_LIMIT
 
-    special_allowance = monthly_ctc - basic - hra - employer_pf
-    gross_salary = basic + hra + special_allowance
-
-    employer_esi = round(gross_salary * ESI_EMPLOYER_RATE) if esi_applicable else 0
+    employer_esi = 0
+    if esi_applicable:
+        # Employer ESI is levied on the gross before ESI itself is carved out
+        special_allowance = monthly_ctc - basic - hra - employer_pf
+        gross_salary = basic + hra + special_allowance
+        employer_esi = round(gross_salary * ESI_EMPLOYER_RATE)
 
     special_allowance = monthly_ctc - basic - hra - employer_pf - employer_esi
     if special_allowance < 0:
@@ -66,12 +97,11 @@ def calculate_salary(
     employee_pf = min(round(pf_basic * PF_EMPLOYEE_RATE), PF_MAX_EMPLOYEE) if pf_enabled else 0
     employee_esi = round(gross_salary * ESI_EMPLOYEE_RATE) if esi_applicable else 0
 
-    pt_fn = PT_RATES.get(state, PT_RATES["Karnataka"])
-    professional_tax = pt_fn(gross_salary) if pt_enabled else 0
+    pt = professional_tax(pt_slabs, gross_salary) if pt_slabs else 0
 
     tds = 0  # Simplified
 
-    total_deductions = employee_pf + employee_esi + professional_tax + tds
+    total_deductions = employee_pf + employee_esi + pt + tds
     net_salary = gross_salary - total_deductions
 
     return {
@@ -83,7 +113,7 @@ def calculate_salary(
         "employer_esi": employer_esi,
         "employee_pf": employee_pf,
         "employee_esi": employee_esi,
-        "professional_tax": professional_tax,
+        "professional_tax": pt,
         "tds": tds,
         "total_deductions": total_deductions,
         "net_salary": net_salary,
@@ -149,9 +179,10 @@ def main():
     passed = 0
     failed = 0
 
-    for tc in TEST_CASES:
+    results = calculate_salaries([tc["annual_ctc"] for tc in TEST_CASES])
+
+    for tc, result in zip(TEST_CASES, results):
         label = tc["label"]
-        result = calculate_salary(tc["annual_ctc"])
         exp = tc["expect"]
         errors = []
 
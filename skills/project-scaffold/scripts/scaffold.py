@@ -8,192 +8,139 @@ Creates the monorepo structure for PayEase with:
 - packages/shared (shared types/utilities)
 """
 
+import argparse
 import os
 import json
+import stat
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
-def create_directory_structure(root: Path):
-    """Create the monorepo directory structure"""
-    
-    directories = [
-        # Apps
-        'apps/api/src/routes',
-        'apps/api/src/services',
-        'apps/api/src/models',
-        'apps/api/src/middleware',
-        'apps/api/src/utils',
-        'apps/api/tests',
-        
-        'apps/web/src/components',
-        'apps/web/src/pages',
-        'apps/web/src/hooks',
-        'apps/web/src/utils',
-        'apps/web/src/styles',
-        'apps/web/public',
-        
-        # Shared packages
-        'packages/shared/src/types',
-        'packages/shared/src/utils',
-        
-        # Agent system
-        'directives',
-        'execution',
-        '.tmp',
-        
-        # Tests
-        'tests/e2e',
-    ]
-    
-    for d in directories:
-        (root / d).mkdir(parents=True, exist_ok=True)
-        
-    print(f"✅ Created {len(directories)} directories")
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder produces the same output
+    orjson = None  # type: ignore[assignment]
 
-def create_root_package_json(root: Path):
-    """Create root package.json with workspaces"""
-    
-    package = {
-        "name": "payease",
-        "version": "0.1.0",
-        "private": True,
-        "workspaces": [
-            "apps/*",
-            "packages/*"
-        ],
-        "scripts": {
-            "dev": "npm run dev --workspaces",
-            "dev:api": "npm run dev --workspace=apps/api",
-            "dev:web": "npm run dev --workspace=apps/web",
-            "build": "npm run build --workspaces",
-            "test": "npm run test --workspaces",
-            "lint": "eslint . --ext .ts,.tsx",
-            "format": "prettier --write .",
-            "db:migrate": "npm run migrate --workspace=apps/api",
-            "db:seed": "npm run seed --workspace=apps/api"
-        },
-        "devDependencies": {
-            "typescript": "^5.3.0",
-            "eslint": "^8.55.0",
-            "prettier": "^3.1.0",
-            "@types/node": "^20.10.0"
-        }
-    }
-    
-    with open(root / 'package.json', 'w') as f:
-        json.dump(package, f, indent=2)
-    
-    print("✅ Created root package.json")
+def _dump_json(obj: Any) -> bytes:
+    """Serialize with 2-space indent, via orjson's C encoder when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
 
-def create_api_package_json(root: Path):
-    """Create API package.json"""
-    
-    package = {
-        "name": "@payease/api",
-        "version": "0.1.0",
-        "private": True,
-        "scripts": {
-            "dev": "nodemon --exec ts-node src/index.ts",
-            "build": "tsc",
-            "start": "node dist/index.js",
-            "test": "jest",
-            "migrate": "prisma migrate dev",
-            "seed": "ts-node prisma/seed.ts"
-        },
-        "dependencies": {
-            "express": "^4.18.2",
-            "cors": "^2.8.5",
-            "helmet": "^7.1.0",
-            "jsonwebtoken": "^9.0.2",
-            "bcryptjs": "^2.4.3",
-            "@prisma/client": "^5.7.0",
-            "zod": "^3.22.4",
-            "dotenv": "^16.3.1"
-        },
-        "devDependencies": {
-            "@types/express": "^4.17.21",
-            "@types/cors": "^2.8.17",
-            "@types/jsonwebtoken": "^9.0.5",
-            "@types/bcryptjs": "^2.4.6",
-            "ts-node": "^10.9.2",
-            "nodemon": "^3.0.2",
-            "jest": "^29.7.0",
-            "prisma": "^5.7.0"
-        }
+# Generated file contents
+
+def _make_pkg(name: str, **fields: Any) -> Dict[str, Any]:
+    """package.json skeleton shared by every workspace; fields keep their order"""
+    pkg = {"name": name, "version": "0.1.0", "private": True}
+    pkg.update(fields)
+    return pkg
+
+ROOT_PACKAGE = _make_pkg(
+    "payease",
+    workspaces=[
+        "apps/*",
+        "packages/*"
+    ],
+    scripts={
+        "dev": "npm run dev --workspaces",
+        "dev:api": "npm run dev --workspace=apps/api",
+        "dev:web": "npm run dev --workspace=apps/web",
+        "build": "npm run build --workspaces",
+        "test": "npm run test --workspaces",
+        "lint": "eslint . --ext .ts,.tsx",
+        "format": "prettier --write .",
+        "db:migrate": "npm run migrate --workspace=apps/api",
+        "db:seed": "npm run seed --workspace=apps/api"
+    },
+    devDependencies={
+        "typescript": "^5.3.0",
+        "eslint": "^8.55.0",
+        "prettier": "^3.1.0",
+        "@types/node": "^20.10.0"
     }
-    
-    with open(root / 'apps/api/package.json', 'w') as f:
-        json.dump(package, f, indent=2)
-    
-    print("✅ Created apps/api/package.json")
+)
 
-def create_web_package_json(root: Path):
-    """Create Web package.json"""
-    
-    package = {
-        "name": "@payease/web",
-        "version": "0.1.0",
-        "private": True,
-        "type": "module",
-        "scripts": {
-            "dev": "vite",
-            "build": "tsc && vite build",
-            "preview": "vite preview",
-            "test": "vitest"
-        },
-        "dependencies": {
-            "react": "^18.2.0",
-            "react-dom": "^18.2.0",
-            "react-router-dom": "^6.21.0",
-            "@tanstack/react-query": "^5.13.0",
-            "axios": "^1.6.2",
-            "zustand": "^4.4.7"
-        },
-        "devDependencies": {
-            "@types/react": "^18.2.43",
-            "@types/react-dom": "^18.2.17",
-            "@vitejs/plugin-react": "^4.2.1",
-            "vite": "^5.0.8",
-            "tailwindcss": "^3.3.6",
-            "autoprefixer": "^10.4.16",
-            "postcss": "^8.4.32",
-            "vitest": "^1.1.0"
-        }
+API_PACKAGE = _make_pkg(
+    "@payease/api",
+    scripts={
+        "dev": "nodemon --exec ts-node src/index.ts",
+        "build": "tsc",
+        "start": "node dist/index.js",
+        "test": "jest",
+        "migrate": "prisma migrate dev",
+        "seed": "ts-node prisma/seed.ts"
+    },
+    dependencies={
+        "express": "^4.18.2",
+        "cors": "^2.8.5",
+        "helmet": "^7.1.0",
+        "jsonwebtoken": "^9.0.2",
+        "bcryptjs": "^2.4.3",
+        "@prisma/client": "^5.7.0",
+        "zod": "^3.22.4",
+        "dotenv": "^16.3.1"
+    },
+    devDependencies={
+        "@types/express": "^4.17.21",
+        "@types/cors": "^2.8.17",
+        "@types/jsonwebtoken": "^9.0.5",
+        "@types/bcryptjs": "^2.4.6",
+        "ts-node": "^10.9.2",
+        "nodemon": "^3.0.2",
+        "jest": "^29.7.0",
+        "prisma": "^5.7.0"
     }
-    
-    with open(root / 'apps/web/package.json', 'w') as f:
-        json.dump(package, f, indent=2)
-    
-    print("✅ Created apps/web/package.json")
+)
 
-def create_tsconfig(root: Path):
-    """Create TypeScript configuration"""
-    
-    tsconfig = {
-        "compilerOptions": {
-            "target": "ES2022",
-            "module": "NodeNext",
-            "moduleResolution": "NodeNext",
-            "strict": True,
-            "esModuleInterop": True,
-            "skipLibCheck": True,
-            "forceConsistentCasingInFileNames": True,
-            "resolveJsonModule": True,
-            "declaration": True,
-            "declarationMap": True,
-            "sourceMap": True
-        },
-        "exclude": ["node_modules", "dist"]
+WEB_PACKAGE = _make_pkg(
+    "@payease/web",
+    type="module",
+    scripts={
+        "dev": "vite",
+        "build": "tsc && vite build",
+        "preview": "vite preview",
+        "test": "vitest"
+    },
+    dependencies={
+        "react": "^18.2.0",
+        "react-dom": "^18.2.0",
+        "react-router-dom": "^6.21.0",
+        "@tanstack/react-query": "^5.13.0",
+        "axios": "^1.6.2",
+        "zustand": "^4.4.7"
+    },
+    devDependencies={
+        "@types/react": "^18.2.43",
+        "@types/react-dom": "^18.2.17",
+        "@vitejs/plugin-react": "^4.2.1",
+        "vite": "^5.0.8",
+        "tailwindcss": "^3.3.6",
+        "autoprefixer": "^10.4.16",
+        "postcss": "^8.4.32",
+        "vitest": "^1.1.0"
     }
-    
-    with open(root / 'tsconfig.json', 'w') as f:
-        json.dump(tsconfig, f, indent=2)
-    
-    print("✅ Created tsconfig.json")
+)
 
-def create_readme(root: Path):
-    """Create README.md"""
-    
-    content = """# PayEase
+TSCONFIG = {
+    "compilerOptions": {
+        "target": "ES2022",
+        "module": "NodeNext",
+        "moduleResolution": "NodeNext",
+        "strict": True,
+        "esModuleInterop": True,
+        "skipLibCheck": True,
+        "forceConsistentCasingInFileNames": True,
+        "resolveJsonModule": True,
+        "declaration": True,
+        "declarationMap": True,
+        "sourceMap": True
+    },
+    "exclude": ["node_modules", "dist"]
+}
+
+README = """# PayEase
 
 Simple payroll management for small businesses.
 
@@ -235,35 +182,237 @@ npm run dev
 
 See `/directives` for development workflows.
 """
+
+# These never change, so serialize them once at import rather than per run.
+_ROOT_PACKAGE_JSON = _dump_json(ROOT_PACKAGE)
+_API_PACKAGE_JSON = _dump_json(API_PACKAGE)
+_WEB_PACKAGE_JSON = _dump_json(WEB_PACKAGE)
+_TSCONFIG_JSON = _dump_json(TSCONFIG)
+_README_BYTES = README.encode()
+
+# Monorepo layout as a trie: each directory name maps to its subdirectories.
+# Shared prefixes (apps/api/src, ...) appear once, so walking it yields
+# every directory exactly once and parents before children.
+DIRECTORY_TREE: Dict[str, Any] = {
+    # Apps
+    'apps': {
+        'api': {
+            'src': {
+                'routes': {},
+                'services': {},
+                'models': {},
+                'middleware': {},
+                'utils': {},
+            },
+            'tests': {},
+        },
+        'web': {
+            'src': {
+                'components': {},
+                'pages': {},
+                'hooks': {},
+                'utils': {},
+                'styles': {},
+            },
+            'public': {},
+        },
+    },
+    
+    # Shared packages
+    'packages': {
+        'shared': {
+            'src': {
+                'types': {},
+                'utils': {},
+            },
+        },
+    },
     
-    with open(root / 'README.md', 'w') as f:
-        f.write(content)
+    # Agent system
+    'directives': {},
+    'execution': {},
+    '.tmp': {},
     
-    print("✅ Created README.md")
+    # Tests
+    'tests': {
+        'e2e': {},
+    },
+}
+
+# Files written by the scaffolder, relative to the project root
+OUTPUT_FILES: Dict[str, str] = {
+    'root_pkg': 'package.json',
+    'api_pkg': 'apps/api/package.json',
+    'web_pkg': 'apps/web/package.json',
+    'tsconfig': 'tsconfig.json',
+    'readme': 'README.md',
+}
+
+def _write_once(path: Path, data: bytes) -> None:
+    """
+    Write data to path with raw os.open/os.write. Skips the buffered/text
+    wrapper layers open() builds, which are pure overhead for one-shot writes.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
-def main():
-    import argparse
+# Where supported (Linux, macOS), mkdir/stat run relative to an fd opened on
+# the project root, so the kernel doesn't re-resolve the root's path
+# components on every call.
+_DIR_FD_OK = os.mkdir in os.supports_dir_fd and os.stat in os.supports_dir_fd
+
+def _mkdir_batch(root: Path, paths: List[Path], root_fd: Optional[int] = None) -> None:
+    """
+    Create every directory in paths (relative to root) in one pass.
+    paths must list parents before children; existing directories are skipped.
+    With root_fd, paths are created relative to that open directory instead.
+    """
+    for p in paths:
+        try:
+            if root_fd is not None:
+                os.mkdir(p, dir_fd=root_fd)
+            else:
+                os.mkdir(root / p)
+        except FileExistsError:
+            # Same as mkdir(exist_ok=True): only an existing directory (or a
+            # symlink to one) is fine; a file in the way is still an error
+            if root_fd is not None:
+                mode = os.stat(p, dir_fd=root_fd).st_mode
+            else:
+                mode = os.stat(root / p).st_mode
+            if not stat.S_ISDIR(mode):
+                raise
+
+def _walk_tree(tree: Dict[str, Any]) -> Iterator[Tuple[Path, bool]]:
+    """
+    Yield (path, is_leaf) for every node of a directory trie, breadth-first,
+    so each shared prefix is visited exactly once and always before its children.
+    """
+    queue = deque((Path(name), children) for name, children in tree.items())
+    while queue:
+        path, children = queue.popleft()
+        yield path, not children
+        queue.extend((path / name, sub) for name, sub in children.items())
+
+def create_directory_structure(root: Path) -> str:
+    """Create the monorepo directory structure"""
     
-    parser = argparse.ArgumentParser(description='Scaffold PayEase project')
-    parser.add_argument('--project-root', default='.', help='Project root directory')
-    args = parser.parse_args()
+    paths: List[Path] = []
+    leaves: List[Path] = []
+    for path, is_leaf in _walk_tree(DIRECTORY_TREE):
+        paths.append(path)
+        if is_leaf:
+            leaves.append(path)
     
-    root = Path(args.project_root).resolve()
+    # Re-runs are the common case: stat the leaves first, and treat an
+    # existing leaf as proof that its whole branch exists, so only missing
+    # directories reach mkdir.
+    root.mkdir(parents=True, exist_ok=True)
+    root_fd = os.open(root, os.O_RDONLY | os.O_DIRECTORY) if _DIR_FD_OK else None
+    try:
+        existing: Set[Path] = set()
+        for leaf in leaves:
+            try:
+                if root_fd is not None:
+                    mode = os.stat(leaf, dir_fd=root_fd, follow_symlinks=False).st_mode
+                else:
+                    mode = os.lstat(root / leaf).st_mode
+            except FileNotFoundError:
+                continue
+            if stat.S_ISDIR(mode):
+                existing.add(leaf)
+                existing.update(leaf.parents)
+        
+        _mkdir_batch(root, [p for p in paths if p not in existing], root_fd)
+    finally:
+        if root_fd is not None:
+            os.close(root_fd)
+        
+    return f"✅ Created {len(leaves)} directories"
+
+def create_root_package_json(path: Path) -> str:
+    """Create root package.json with workspaces"""
+    
+    _write_once(path, _ROOT_PACKAGE_JSON)
     
-    print(f"\n=== Scaffolding PayEase at {root} ===\n")
+    return "✅ Created root package.json"
+
+def create_api_package_json(path: Path) -> str:
+    """Create API package.json"""
+    
+    _write_once(path, _API_PACKAGE_JSON)
     
-    create_directory_structure(root)
-    create_root_package_json(root)
-    create_api_package_json(root)
-    create_web_package_json(root)
-    create_tsconfig(root)
-    create_readme(root)
+    return "✅ Created apps/api/package.json"
+
+def create_web_package_json(path: Path) -> str:
+    """Create Web package.json"""
+    
+    _write_once(path, _WEB_PACKAGE_JSON)
+    
+    return "✅ Created apps/web/package.json"
+
+def create_tsconfig(path: Path) -> str:
+    """Create TypeScript configuration"""
+    
+    _write_once(path, _TSCONFIG_JSON)
+    
+    return "✅ Created tsconfig.json"
+
+def create_readme(path: Path) -> str:
+    """Create README.md"""
+    
+    _write_once(path, _README_BYTES)
+    
+    return "✅ Created README.md"
+
+_PARSER = argparse.ArgumentParser(description='Scaffold PayEase project')
+_PARSER.add_argument('--project-root', default='.', help='Project root directory')
+
+def scaffold(root: Path) -> List[str]:
+    """
+    Create the full project at root and return the status lines.
+    In-process callers can use this directly.
+    """
+    log = [create_directory_structure(root)]
+    
+    # Resolve every target path once; the writers only deal with payloads
+    paths = {name: root / rel for name, rel in OUTPUT_FILES.items()}
+    
+    # The files are independent, so their open/write/close calls can overlap.
+    # Results come back in submission order, keeping the output stable.
+    writers = [
+        (create_root_package_json, paths['root_pkg']),
+        (create_api_package_json, paths['api_pkg']),
+        (create_web_package_json, paths['web_pkg']),
+        (create_tsconfig, paths['tsconfig']),
+        (create_readme, paths['readme']),
+    ]
+    with ThreadPoolExecutor(max_workers=len(writers)) as pool:
+        log.extend(pool.map(lambda job: job[0](job[1]), writers))
+    
+    return log
+
+def main() -> None:
+    args = _PARSER.parse_args()
+    
+    root = Path(args.project_root).resolve()
     
-    print(f"\n✅ Scaffolding complete!")
-    print("\nNext steps:")
-    print("  1. npm install")
-    print("  2. cp .env.example .env")
-    print("  3. npm run dev")
+    # Collect everything and emit it with a single write
+    log = [f"\n=== Scaffolding PayEase at {root} ===\n"]
+    log.extend(scaffold(root))
+    log.extend([
+        "\n✅ Scaffolding complete!",
+        "\nNext steps:",
+        "  1. npm install",
+        "  2. cp .env.example .env",
+        "  3. npm run dev",
+    ])
+    sys.stdout.write('\n'.join(log) + '\n')
 
 if __name__ == '__main__':
     main()